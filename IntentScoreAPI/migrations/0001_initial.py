@@ -0,0 +1,39 @@
+# Generated by Django 5.1.4 on 2026-10-19 14:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Lead',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255)),
+                ('role', models.CharField(max_length=255)),
+                ('company', models.CharField(max_length=255)),
+                ('industry', models.CharField(max_length=255)),
+                ('location', models.CharField(max_length=255)),
+                ('linkedin_bio', models.CharField(max_length=255)),
+                ('intent', models.CharField(max_length=10)),
+                ('score', models.IntegerField(default=0)),
+                ('reasoning', models.TextField(blank=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ProductOffer',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255)),
+                ('value_props', models.JSONField(default=list)),
+                ('ideal_use_cases', models.JSONField(default=list)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,77 @@
+import threading
+import time
+from datetime import datetime, timezone
+
+from django.conf import settings
+from django.core.cache import cache
+
+
+STATE_KEY = 'intentscore:leads-state'
+
+
+def _utcnow():
+    return datetime.now(timezone.utc)
+
+
+# Cache for rendered read-only responses (/results/, /csv/).
+# The leads generation and its Last-Modified time live in Django's cache so
+# every worker sees the same value; only the rendered bodies are per process.
+# Every write to the leads table bumps the generation, which changes the ETag
+# handed out to clients and makes the cached bodies unusable.
+class ResponseCache:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._bodies = {}
+
+    def _new_state(self):
+        # Clock-based so ETags issued before a restart or cache flush never match
+        return time.time_ns(), _utcnow().replace(microsecond=0)
+
+    def _read_state(self):
+        state = cache.get(STATE_KEY)
+        if state is None:
+            cache.add(STATE_KEY, self._new_state(), timeout=None)
+            state = cache.get(STATE_KEY) or self._new_state()
+        return state
+
+    def state(self, request):
+        # Read once per request so the ETag and the cached body always agree
+        if not hasattr(request, '_response_cache_state'):
+            request._response_cache_state = self._read_state()
+        return request._response_cache_state
+
+    def bump(self):
+        # Written blindly rather than read-modify-write: the file-based cache
+        # has no atomic add/incr, and a fresh clock reading is already unique
+        # per bump and never ahead of the server's Date header
+        cache.set(STATE_KEY, self._new_state(), timeout=None)
+
+    def etag(self, request, key):
+        generation, _ = self.state(request)
+        return f'"{key}-{generation}"'
+
+    def last_modified(self, request):
+        _, last_modified = self.state(request)
+        # HTTP dates only have second precision, so another write could still
+        # land in the current second; only hand out a Last-Modified once its
+        # second is over, otherwise If-Modified-Since could miss that write
+        if last_modified >= _utcnow().replace(microsecond=0):
+            return None
+        return last_modified
+
+    def get(self, key, generation):
+        with self._lock:
+            entry = self._bodies.get(key)
+        if entry is None or entry[0] != generation:
+            return None
+        return entry[1], entry[2]
+
+    def set(self, key, generation, content, content_type):
+        with self._lock:
+            if len(content) > settings.RESPONSE_CACHE_MAX_BYTES:
+                self._bodies.pop(key, None)
+                return
+            self._bodies[key] = (generation, content, content_type)
+
+
+response_cache = ResponseCache()
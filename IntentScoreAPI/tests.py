@@ -1,3 +1,145 @@
-from django.test import TestCase
+from django.test import TestCase, override_settings
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.urls import reverse
+from django.utils.http import parse_http_date
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+import time
+
+from .models import Lead, ProductOffer
+from .response_cache import response_cache
 
 # Create your tests here.
+
+TEST_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'intentscore-tests',
+    }
+}
+
+CSV_CONTENT = (
+    b"name,role,company,industry,location,linkedin_bio\n"
+    b"John Doe,CEO,TechCorp,SaaS,San Francisco,Builds software\n"
+)
+
+
+@override_settings(CACHES=TEST_CACHES)
+class ResponseCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        Lead.objects.create(
+            name='Jane Smith', role='Marketing Director', company='RetailMax Inc',
+            industry='E-commerce', location='New York', linkedin_bio='Growth marketer'
+        )
+
+    def test_if_none_match_returns_304_without_queries(self):
+        for name in ('get-results', 'export-csv'):
+            response = self.client.get(reverse(name))
+            self.assertEqual(response.status_code, 200)
+            with self.assertNumQueries(0):
+                response = self.client.get(reverse(name), HTTP_IF_NONE_MATCH=response['ETag'])
+            self.assertEqual(response.status_code, 304)
+
+    def later_clock(self):
+        # Move past the second of the last write so Last-Modified is sent
+        later = datetime.now(timezone.utc) + timedelta(seconds=2)
+        return patch('IntentScoreAPI.response_cache._utcnow', return_value=later)
+
+    def test_if_modified_since_returns_304_without_queries(self):
+        response_cache.bump()
+        with self.later_clock():
+            for name in ('get-results', 'export-csv'):
+                response = self.client.get(reverse(name))
+                with self.assertNumQueries(0):
+                    response = self.client.get(
+                        reverse(name), HTTP_IF_MODIFIED_SINCE=response['Last-Modified']
+                    )
+                self.assertEqual(response.status_code, 304)
+
+    def test_last_modified_withheld_during_write_second(self):
+        response_cache.bump()
+        response = self.client.get(reverse('get-results'))
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.has_header('Last-Modified'))
+
+    def test_post_still_returns_405(self):
+        for name in ('get-results', 'export-csv'):
+            etag = self.client.get(reverse(name))['ETag']
+            for header in ('HTTP_IF_MATCH', 'HTTP_IF_NONE_MATCH'):
+                response = self.client.post(reverse(name), **{header: etag})
+                self.assertEqual(response.status_code, 405)
+
+    def test_cached_body_served_without_queries(self):
+        first = self.client.get(reverse('get-results'))
+        with self.assertNumQueries(0):
+            second = self.client.get(reverse('get-results'))
+        self.assertEqual(first.content, second.content)
+
+    def test_upload_changes_etag(self):
+        before = self.client.get(reverse('get-results'))
+        upload = self.client.post(
+            reverse('upload-leads'),
+            {'csv_file': SimpleUploadedFile('leads.csv', CSV_CONTENT, content_type='text/csv')},
+        )
+        self.assertEqual(upload.status_code, 201)
+
+        after = self.client.get(reverse('get-results'), HTTP_IF_NONE_MATCH=before['ETag'])
+        self.assertEqual(after.status_code, 200)
+        self.assertNotEqual(after['ETag'], before['ETag'])
+        self.assertEqual(after.json()[0]['name'], 'John Doe')
+
+    def test_failed_upload_keeps_etag(self):
+        before = self.client.get(reverse('get-results'))
+        self.client.post(
+            reverse('upload-leads'),
+            {'csv_file': SimpleUploadedFile('leads.csv', b"name\nJohn\n", content_type='text/csv')},
+        )
+        after = self.client.get(reverse('get-results'), HTTP_IF_NONE_MATCH=before['ETag'])
+        self.assertEqual(after.status_code, 304)
+
+    @patch('IntentScoreAPI.views.LeadScoringService')
+    def test_score_changes_etag(self, scoring_service):
+        scoring_service.return_value.score_lead.return_value = {
+            'intent': 'High', 'score': 80, 'reasoning': 'Good fit',
+            'rule_score': 40, 'ai_score': 40,
+        }
+        ProductOffer.objects.create(name='AI Outreach', value_props=[], ideal_use_cases=[])
+        before = self.client.get(reverse('export-csv'))
+
+        response = self.client.post(reverse('score-leads'))
+        self.assertEqual(response.status_code, 200)
+
+        after = self.client.get(reverse('export-csv'), HTTP_IF_NONE_MATCH=before['ETag'])
+        self.assertEqual(after.status_code, 200)
+        self.assertNotEqual(after['ETag'], before['ETag'])
+        self.assertIn(b'High,80,Good fit', after.content)
+
+    @patch('IntentScoreAPI.views.LeadScoringService')
+    def test_score_keeps_last_modified_behind_clock(self, scoring_service):
+        scoring_service.return_value.score_lead.return_value = {
+            'intent': 'Low', 'score': 20, 'reasoning': 'Weak fit',
+            'rule_score': 10, 'ai_score': 10,
+        }
+        ProductOffer.objects.create(name='AI Outreach', value_props=[], ideal_use_cases=[])
+        for i in range(20):
+            Lead.objects.create(
+                name=f'Lead {i}', role='Analyst', company='Acme', industry='Retail',
+                location='Austin', linkedin_bio='Bio'
+            )
+
+        self.client.post(reverse('score-leads'))
+        self.client.post(reverse('score-leads'))
+
+        with self.later_clock():
+            response = self.client.get(reverse('get-results'))
+        self.assertLessEqual(parse_http_date(response['Last-Modified']), time.time())
+
+    @override_settings(RESPONSE_CACHE_MAX_BYTES=4)
+    def test_body_over_max_bytes_not_stored(self):
+        response_cache.set('results', 1, b'small', 'application/json')
+        self.assertIsNone(response_cache.get('results', 1))
+
+        response_cache.set('results', 1, b'tiny', 'application/json')
+        self.assertEqual(response_cache.get('results', 1), (b'tiny', 'application/json'))
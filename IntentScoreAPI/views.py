@@ -4,12 +4,17 @@ from django.shortcuts import render
 from rest_framework import status
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
+from rest_framework.renderers import JSONRenderer
 from .models import Lead,ProductOffer
 from .serializers import ProductOfferSerializer,LeadUploadSerializer,LeadSerializer,ScoringResultSerializer
 import pandas as pd
 from .services import LeadScoringService
+from .response_cache import response_cache
+from django.db import transaction
 from django.http import HttpResponse
+from django.views.decorators.http import condition
 import json
+import time
 
 
 @api_view(['GET'])
@@ -96,9 +101,6 @@ def upload_leads(request):
                 status = status.HTTP_400_BAD_REQUEST
             )
         
-        # clear existing leads
-        Lead.objects.all().delete()
-        
         leads = []
         
         # save leads to db
@@ -115,8 +117,13 @@ def upload_leads(request):
             
             leads.append(lead)
             
+        with transaction.atomic():
+            # clear existing leads
+            Lead.objects.all().delete()
+            
             # saving bulk data into db
-        Lead.objects.bulk_create(leads)
+            Lead.objects.bulk_create(leads)
+        response_cache.bump()
             
         return Response(
             {'message':f'Successfully uploaded {len(leads)} leads'},
@@ -132,6 +139,7 @@ def upload_leads(request):
 @api_view(['POST'])
 def score_leads(request):
     
+    saved = 0
     try:
         offer = ProductOffer.objects.last()
         if not offer:
@@ -157,6 +165,7 @@ def score_leads(request):
         }
         
         results = []
+        last_bump = time.monotonic()
         
         for lead in leads:
             lead_data = {
@@ -174,6 +183,12 @@ def score_leads(request):
             lead.score = scoring_result['score']
             lead.reasoning = scoring_result['reasoning']
             lead.save()
+            saved += 1
+            
+            # let pollers see partial progress, but at most once per second
+            if time.monotonic() - last_bump >= 1:
+                response_cache.bump()
+                last_bump = time.monotonic()
             
             results.append({
                 'name':lead.name,
@@ -186,44 +201,72 @@ def score_leads(request):
                 'reasoning':lead.reasoning
             })
             
+        response_cache.bump()
         serializer = ScoringResultSerializer(results,many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
         
     except Exception as e:
+        # some leads may already have been saved with new scores
+        if saved:
+            response_cache.bump()
         return Response(
             {'error':f'Error scoring leads: {str(e)}'},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
         
+def _results_etag(request):
+    return response_cache.etag(request, 'results')
+
+def _csv_etag(request):
+    return response_cache.etag(request, 'csv')
+
+def _last_modified(request):
+    return response_cache.last_modified(request)
+
+def _cached_response(request, key, build):
+    generation, _ = response_cache.state(request)
+    cached = response_cache.get(key, generation)
+    if cached is None:
+        cached = build()
+        response_cache.set(key, generation, *cached)
+    content, content_type = cached
+    return HttpResponse(content, content_type=content_type)
+
 @api_view(['GET'])
+@condition(etag_func=_results_etag, last_modified_func=_last_modified)
 def get_results(request):
     
-    leads = Lead.objects.all()
-    serializer = LeadSerializer(leads, many=True)
-    return Response(serializer.data, status=status.HTTP_200_OK)
+    def build():
+        leads = Lead.objects.all()
+        serializer = LeadSerializer(leads, many=True)
+        return JSONRenderer().render(serializer.data), 'application/json'
+    
+    return _cached_response(request, 'results', build)
 
 @api_view(['GET'])
+@condition(etag_func=_csv_etag, last_modified_func=_last_modified)
 def export_results_csv(request):
     
-    leads = Lead.objects.all()
-    response = HttpResponse(content_type='text/csv')
-    response['Content-Disposition'] = 'attachment; filename="lead_scores.csv"'
-    
-    df_data = []
+    def build():
+        leads = Lead.objects.all()
+        df_data = []
+        
+        for lead in leads:
+            df_data.append({
+                'Name':lead.name,
+                'Role':lead.role,
+                'Company':lead.company,
+                'Industry':lead.industry,
+                'Location':lead.location,
+                'Intent':lead.intent,
+                'Score':lead.score,
+                'Reasoning':lead.reasoning
+            })
+            
+        df = pd.DataFrame(df_data)
+        return df.to_csv(index=False).encode('utf-8'), 'text/csv'
     
-    for lead in leads:
-        df_data.append({
-            'Name':lead.name,
-            'Role':lead.role,
-            'Company':lead.company,
-            'Industry':lead.industry,
-            'Location':lead.location,
-            'Intent':lead.intent,
-            'Score':lead.score,
-            'Reasoning':lead.reasoning
-        })
-        
-    df = pd.DataFrame(df_data)
-    df.to_csv(response,index=False)
+    response = _cached_response(request, 'csv', build)
+    response['Content-Disposition'] = 'attachment; filename="lead_scores.csv"'
     
     return response
\ No newline at end of file